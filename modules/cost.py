@@ -11,6 +11,12 @@ This is where the domain rules live.
 
 from typing import Dict, List, Optional
 
+import numpy as np
+
+# Vehicle type ids used to index the precomputed cost table
+_TRUCK = 0
+_DRONE = 1
+
 
 class CostCalculator:
     """
@@ -36,85 +42,87 @@ class CostCalculator:
         """
         self.road_weights = road_weights
         self.sensors = sensor_data
-        
-        # Cache: (road_type, time, vehicle_type) -> cost
-        self._cache = {}
-    
-    def get_cost(self, road_type: int, time: int, vehicle_type: str) -> Optional[float]:
+
+        # Vectorized cost tables: one pass over all (road_type, time) pairs.
+        # W[rt-1, t] is the base weight of road type rt at time t.
+        W = np.stack([
+            np.asarray(road_weights[str(rt)], dtype=np.float32)
+            for rt in range(1, 6)
+        ])
+
+        # S[4, T]: sensor rows in the order the kernel expects
+        S = np.stack([
+            np.asarray(sensor_data[key], dtype=np.float32)
+            for key in ('earth_shock', 'rainfall', 'wind', 'visibility')
+        ])
+        self.W = W
+        self.S = S
+
+        # Blocking masks (AND rule), fused into single broadcast
+        # expressions over [5, T]; kept as attributes so callers can
+        # inspect blocked (road_type, time) pairs directly
+        self.blocked_truck = (W * S[0] > 10) & (W * S[1] > 30)
+        self.blocked_drone = (W * S[2] > 60) & (W * S[3] < 6)
+
+        # Final per-road-type costs [5, T]: base × road_type, ×5 if blocked
+        base = W * np.arange(1, 6, dtype=np.float32)[:, None]
+        self._truck_cost = np.where(self.blocked_truck, base * 5, base)
+        self._drone_cost = np.where(self.blocked_drone, base * 5, base)
+
+        # Dense lookup table [vtype, road_type, time]: the whole
+        # (2 x 7 x T) key space, materialized once. NaN marks invalid
+        # edges; row 6 stays NaN so road_type -1 indexes it directly.
+        T = W.shape[1]
+        self._cost_table = np.full((2, 7, T), np.nan, dtype=np.float32)
+        self._cost_table[_TRUCK, 1:6] = self._truck_cost
+        self._cost_table[_DRONE, 1:6] = self._drone_cost
+        self._cost_table[_DRONE, 0] = 0.0  # airspace: free for drones
+
+    def build_cost_tensor(self, adjacency_matrix: List[List[int]],
+                          vehicle_type: str) -> np.ndarray:
         """
-        Calculate traversal cost for an edge.
-        
-        This is the core physics function.
-        
+        Build the dense time-expanded cost tensor for one vehicle type.
+
         Args:
-            road_type: Road type (0-5 or -1)
-            time: Time step
+            adjacency_matrix: NxN road type matrix
             vehicle_type: "truck" or "drone"
-            
+
         Returns:
-            Cost to traverse, or None if invalid
+            cost[T, N, N] float32 array; NaN marks edges the vehicle
+            cannot traverse (no road, or airspace for trucks)
         """
-        # Check cache
-        cache_key = (road_type, time, vehicle_type)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-        
-        # No road
-        if road_type == -1:
-            self._cache[cache_key] = None
-            return None
-        
-        # Trucks cannot use airspace
-        if vehicle_type == "truck" and road_type == 0:
-            self._cache[cache_key] = None
-            return None
-        
-        # Road Type 0: Free for drones, never blocked
-        if road_type == 0:
-            self._cache[cache_key] = 0.0
-            return 0.0
-        
-        # Road Types 1-5: Compute cost with weather
-        base_weight = self.road_weights[str(road_type)][time]
-        is_blocked = self._is_blocked(base_weight, time, vehicle_type)
-        
-        # Calculate final cost
-        base_cost = base_weight * road_type
-        final_cost = base_cost * 5 if is_blocked else base_cost
-        
-        self._cache[cache_key] = final_cost
-        return final_cost
-    
-    def _is_blocked(self, base_weight: float, time: int, vehicle_type: str) -> bool:
+        adj = np.asarray(adjacency_matrix)
+        per_rt = self._truck_cost if vehicle_type == "truck" else self._drone_cost
+        T = per_rt.shape[1]
+        N = adj.shape[0]
+
+        cost = np.full((T, N, N), np.nan, dtype=np.float32)
+
+        for rt in range(1, 6):
+            mask = adj == rt
+            if mask.any():
+                cost[:, mask] = per_rt[rt - 1][:, None]
+
+        # Airspace: free for drones, forbidden for trucks
+        if vehicle_type == "drone":
+            cost[:, adj == 0] = 0.0
+
+        return cost
+
+    def get_cost(self, road_type: int, time: int, vehicle_type: str) -> Optional[float]:
         """
-        Check if road is blocked (hazardous) based on weather.
+        Calculate traversal cost for an edge.
         
-        CRITICAL: Uses AND rule - BOTH conditions must be true.
+        This is the core physics function.
         
         Args:
-            base_weight: Base weight of the road
+            road_type: Road type (0-5 or -1)
             time: Time step
             vehicle_type: "truck" or "drone"
             
         Returns:
-            True if road is blocked
+            Cost to traverse, or None if invalid
         """
-        if vehicle_type == "truck":
-            # Truck blocking rule
-            earth_shock = self.sensors['earth_shock'][time]
-            rainfall = self.sensors['rainfall'][time]
-            
-            condition1 = (base_weight * earth_shock) > 10
-            condition2 = (base_weight * rainfall) > 30
-            
-            return condition1 and condition2  # BOTH must be true
-            
-        else:  # drone
-            # Drone blocking rule
-            wind = self.sensors['wind'][time]
-            visibility = self.sensors['visibility'][time]
-            
-            condition1 = (base_weight * wind) > 60
-            condition2 = (base_weight * visibility) < 6
-            
-            return condition1 and condition2  # BOTH must be true
\ No newline at end of file
+        vtype = _TRUCK if vehicle_type == "truck" else _DRONE
+        cost = self._cost_table[vtype, road_type, time]
+        return None if np.isnan(cost) else float(cost)
\ No newline at end of file
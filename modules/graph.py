@@ -7,6 +7,8 @@ Does NOT handle costs - that's in cost.py.
 
 from typing import List, Tuple
 
+import numpy as np
+
 
 class Graph:
     """
@@ -30,35 +32,49 @@ class Graph:
         """
         self.adjacency_matrix = adjacency_matrix
         self.num_nodes = len(adjacency_matrix)
-    
+
+        # Per-vehicle CSR adjacency: neighbors of node n are the slice
+        # nbrs[indptr[n]:indptr[n+1]], with road types alongside.
+        # Trucks skip road types -1 and 0; drones skip only -1.
+        adj = np.asarray(adjacency_matrix, dtype=np.int8)
+        self.adj = adj
+        self._csr = {
+            'truck': self._build_csr(adj, adj >= 1),
+            'drone': self._build_csr(adj, adj >= 0),
+        }
+
+    @staticmethod
+    def _build_csr(adj: np.ndarray,
+                   valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compress the valid entries of the adjacency matrix to CSR form.
+
+        Args:
+            adj: NxN road type matrix
+            valid: NxN boolean mask of traversable edges
+
+        Returns:
+            (indptr, neighbors, road_types) arrays
+        """
+        rows, cols = np.nonzero(valid)
+        indptr = np.zeros(adj.shape[0] + 1, dtype=np.int32)
+        np.cumsum(valid.sum(axis=1), out=indptr[1:])
+        return indptr, cols.astype(np.int32), adj[rows, cols]
+
     def get_neighbors(self, node: int, vehicle_type: str) -> List[Tuple[int, int]]:
         """
         Get valid neighbors for a vehicle at a node.
-        
+
         Args:
             node: Current node
             vehicle_type: "truck" or "drone"
-            
+
         Returns:
             List of (neighbor_node, road_type) tuples
         """
-        neighbors = []
-        
-        for next_node in range(self.num_nodes):
-            road_type = self.adjacency_matrix[node][next_node]
-            
-            # No road exists
-            if road_type == -1:
-                continue
-            
-            # CRITICAL: Trucks cannot use Road Type 0 (airspace)
-            if vehicle_type == "truck" and road_type == 0:
-                continue
-            
-            # Valid neighbor
-            neighbors.append((next_node, road_type))
-        
-        return neighbors
+        indptr, nbrs, rtypes = self._csr[vehicle_type]
+        lo, hi = indptr[node], indptr[node + 1]
+        return list(zip(nbrs[lo:hi], rtypes[lo:hi]))
     
     def is_valid_edge(self, from_node: int, to_node: int, vehicle_type: str) -> bool:
         """
@@ -4,14 +4,17 @@ Planner Module
 The brain of the system:
 - Prioritizes objectives
 - Assigns to vehicles
-- Runs A* pathfinding
+- Runs time-expanded Dijkstra pathfinding
 - Computes scores
 - Builds full paths
 """
 
-import heapq
 from typing import List, Dict, Tuple, Optional
 
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import dijkstra
+
 
 class Planner:
     """
@@ -44,9 +47,28 @@ class Planner:
         self.num_trucks = 3
         self.num_drones = 2
         
+        # Objective fields as arrays, for vectorized prioritization
+        self._obj_release = np.array([o['release'] for o in objectives])
+        self._obj_deadline = np.array([o['deadline'] for o in objectives])
+        self._obj_points = np.array([o['points'] for o in objectives])
+
         # Initialize vehicles
         self.vehicles = self._init_vehicles()
-    
+
+        # Time-expanded CSR graphs, one per vehicle type.
+        # Node (n, t) is indexed as t*N + n; all edges go from layer t
+        # to layer t+1, priced at the departure time t.
+        self._expanded = {
+            vtype: self._build_time_expanded_graph(vtype)
+            for vtype in ('truck', 'drone')
+        }
+
+        # SSSP cache: (vehicle_type, node, time) -> (dist, predecessors).
+        # One Dijkstra sweep answers every (target, deadline) query from
+        # that state, and a state's answer never changes, so results are
+        # shared across all objectives evaluated between vehicle moves.
+        self._sssp_cache = {}
+
     def solve(self) -> Dict[str, List[int]]:
         """
         Main solving algorithm.
@@ -65,10 +87,11 @@ class Planner:
         solution = {}
         for vehicle in self.vehicles:
             # Extend to T steps by waiting at current location
-            while len(vehicle['path']) < self.T:
-                vehicle['path'].append(vehicle['current_node'])
-            
-            solution[vehicle['id']] = vehicle['path']
+            if vehicle['path_len'] < self.T:
+                vehicle['path'][vehicle['path_len']:self.T] = vehicle['current_node']
+                vehicle['path_len'] = self.T
+
+            solution[vehicle['id']] = vehicle['path'][:vehicle['path_len']]
         
         return solution
     
@@ -82,6 +105,17 @@ class Planner:
         """Count completed objectives."""
         return sum(len(v['objectives']) for v in self.vehicles)
     
+    def _new_path(self) -> np.ndarray:
+        """
+        Preallocated int32 path buffer, seeded with the start node.
+
+        Paths are appended via an index cursor ('path_len') instead of
+        list appends; capacity T+1 covers the latest possible arrival.
+        """
+        path = np.empty(self.T + 1, dtype=np.int32)
+        path[0] = self.start_node
+        return path
+
     def _init_vehicles(self) -> List[Dict]:
         """Initialize vehicle fleet."""
         vehicles = []
@@ -92,7 +126,8 @@ class Planner:
                 'type': 'truck',
                 'current_node': self.start_node,
                 'current_time': 0,
-                'path': [self.start_node],
+                'path': self._new_path(),
+                'path_len': 1,
                 'total_cost': 0.0,
                 'total_points': 0.0,
                 'objectives': []
@@ -104,7 +139,8 @@ class Planner:
                 'type': 'drone',
                 'current_node': self.start_node,
                 'current_time': 0,
-                'path': [self.start_node],
+                'path': self._new_path(),
+                'path_len': 1,
                 'total_cost': 0.0,
                 'total_points': 0.0,
                 'objectives': []
@@ -118,11 +154,12 @@ class Planner:
         
         Heuristic: High points / tight deadline = high priority
         """
-        def priority_key(obj):
-            time_window = obj['deadline'] - obj['release'] + 1
-            return -obj['points'] / max(1, time_window)
-        
-        return sorted(self.objectives, key=priority_key)
+        time_window = self._obj_deadline - self._obj_release + 1
+        keys = -self._obj_points / np.maximum(1, time_window)
+
+        # Stable sort preserves input order on ties, like sorted() did
+        order = np.argsort(keys, kind='stable')
+        return [self.objectives[i] for i in order]
     
     def _assign_objective(self, obj: Dict):
         """
@@ -131,153 +168,251 @@ class Planner:
         Args:
             obj: Objective dictionary
         """
-        best_vehicle = None
-        best_benefit = -float('inf')
-        best_data = None
-        
-        # Evaluate each vehicle
-        for vehicle in self.vehicles:
+        n = len(self.vehicles)
+        costs = np.full(n, np.inf)
+        arrivals = np.full(n, -1)
+
+        # Query cheapest cost and arrival per vehicle (no paths yet)
+        for i, vehicle in enumerate(self.vehicles):
             if vehicle['current_time'] > obj['deadline']:
                 continue
-            
-            # Find path to objective
-            path, cost, arrival = self._find_path(
+
+            found = self._best_arrival(
+                vehicle['type'],
                 vehicle['current_node'],
                 vehicle['current_time'],
                 obj['node'],
-                vehicle['type'],
                 obj['deadline']
             )
-            
-            if path is None:
-                continue
-            
+
+            if found is not None:
+                costs[i], arrivals[i] = found
+
+        reachable = arrivals >= 0
+        if not reachable.any():
+            return
+
+        # Score all vehicles at once: wait until release if early, then
+        # score the post-wait arrivals and subtract travel cost
+        arr = np.maximum(arrivals, obj['release'])
+        points_all = self._calculate_score(arr, obj)
+        benefit = np.where(reachable, points_all - costs, -np.inf)
+
+        # argmax keeps the earliest vehicle on ties, matching the old
+        # strictly-greater scan order
+        best = int(np.argmax(benefit))
+
+        # Assign to best vehicle
+        if benefit[best] > 0:
+            best_vehicle = self.vehicles[best]
+            points = float(points_all[best])
+
+            # Reconstruct the path only for the winner
+            path, edge_costs, cost, arrival = self._find_path(
+                best_vehicle['current_node'],
+                best_vehicle['current_time'],
+                obj['node'],
+                best_vehicle['type'],
+                obj['deadline']
+            )
+
             # Wait if arriving before release
             if arrival < obj['release']:
                 wait = obj['release'] - arrival
                 path.extend([obj['node']] * wait)
+                edge_costs.extend([0.0] * wait)
                 arrival = obj['release']
-            
-            # Calculate points
-            points = self._calculate_score(arrival, obj)
-            
-            # Net benefit
-            benefit = points - cost
-            
-            if benefit > best_benefit and benefit > 0:
-                best_benefit = benefit
-                best_vehicle = vehicle
-                best_data = (path, cost, arrival, points)
-        
-        # Assign to best vehicle
-        if best_vehicle and best_data:
-            path, cost, arrival, points = best_data
-            
-            # Update vehicle path (skip first node, already there)
-            for node in path[1:]:
-                if node == best_vehicle['current_node']:
-                    # Waiting - zero cost
-                    best_vehicle['path'].append(node)
-                    best_vehicle['current_time'] += 1
-                else:
-                    # Moving - calculate cost at CURRENT time (before moving)
-                    edge_cost = self.cost_calc.get_cost(
-                        self.graph.get_road_type(best_vehicle['current_node'], node),
-                        best_vehicle['current_time'],  # CRITICAL: Use time BEFORE move
-                        best_vehicle['type']
-                    )
-                    
-                    # Update path and state
-                    best_vehicle['path'].append(node)
-                    if edge_cost is not None:
-                        best_vehicle['total_cost'] += edge_cost
-                    best_vehicle['current_node'] = node
-                    best_vehicle['current_time'] += 1
+
+            # Update vehicle path (skip first node, already there);
+            # edge costs come straight from the search, already priced
+            # at the departure time of each step
+            vpath = best_vehicle['path']
+            for node, edge_cost in zip(path[1:], edge_costs):
+                vpath[best_vehicle['path_len']] = node
+                best_vehicle['path_len'] += 1
+                best_vehicle['total_cost'] += edge_cost
+                best_vehicle['current_node'] = node
+                best_vehicle['current_time'] += 1
             
             best_vehicle['total_points'] += points
             best_vehicle['objectives'].append(obj)
     
-    def _find_path(self, start_node: int, start_time: int, 
+    def _build_time_expanded_graph(self, vehicle_type: str) -> sparse.csr_matrix:
+        """
+        Build the time-expanded graph for one vehicle type.
+
+        Layers 0..T are stacked; node (n, t) gets index t*N + n.
+        Move edges (t*N+i) -> ((t+1)*N+j) carry the traversal cost at
+        departure time t; wait edges (t*N+n) -> ((t+1)*N+n) are free.
+
+        Args:
+            vehicle_type: "truck" or "drone"
+
+        Returns:
+            CSR matrix of shape ((T+1)*N, (T+1)*N)
+        """
+        N = self.graph.num_nodes
+        T = self.T
+
+        cost = self.cost_calc.build_cost_tensor(
+            self.graph.adjacency_matrix, vehicle_type
+        )
+
+        # Edge validity is time-independent (weather only scales costs),
+        # so one layer's NaN mask identifies all traversable edges.
+        src, dst = np.nonzero(~np.isnan(cost[0]))
+
+        t = np.arange(T)[:, None]
+        rows = (t * N + src).ravel()
+        cols = ((t + 1) * N + dst).ravel()
+        data = cost[:, src, dst].ravel()
+
+        # Wait edges: stay at the same node, zero cost.  Explicit zeros
+        # are kept in the sparse matrix so csgraph treats them as edges.
+        wait = np.arange(T * N)
+        rows = np.concatenate([rows, wait])
+        cols = np.concatenate([cols, wait + N])
+        data = np.concatenate([data, np.zeros(T * N, dtype=np.float32)])
+
+        size = (T + 1) * N
+        return sparse.csr_matrix((data, (rows, cols)), shape=(size, size))
+
+    def _sssp_from(self, vehicle_type: str, node: int,
+                   time: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Shortest costs from one (node, time) state to all states.
+
+        Results are memoized: every objective evaluated while a vehicle
+        sits in the same state reuses the same sweep.
+
+        Args:
+            vehicle_type: "truck" or "drone"
+            node: Source node
+            time: Source time
+
+        Returns:
+            (dist, predecessors) arrays over the time-expanded graph
+        """
+        key = (vehicle_type, node, time)
+        if key not in self._sssp_cache:
+            source = time * self.graph.num_nodes + node
+            self._sssp_cache[key] = dijkstra(
+                self._expanded[vehicle_type],
+                indices=source,
+                return_predecessors=True
+            )
+        return self._sssp_cache[key]
+
+    def _best_arrival(self, vehicle_type: str, start_node: int,
+                      start_time: int, target_node: int,
+                      deadline: int) -> Optional[Tuple[float, int]]:
+        """
+        Cheapest cost and arrival time to reach a target by a deadline.
+
+        Pure table read over the cached Dijkstra sweep; no path is
+        built, so losing candidates in the assignment loop stay cheap.
+
+        Args:
+            vehicle_type: "truck" or "drone"
+            start_node: Starting node
+            start_time: Starting time
+            target_node: Target node
+            deadline: Latest acceptable arrival
+
+        Returns:
+            (total_cost, arrival_time), or None if unreachable
+        """
+        N = self.graph.num_nodes
+        horizon = min(deadline, self.T)
+
+        # Target outside the graph is unreachable (the old A* simply
+        # never popped it); guard before flat indexing aliases it
+        if not 0 <= target_node < N or horizon < start_time:
+            return None
+
+        dist = self._sssp_from(vehicle_type, start_node, start_time)[0]
+
+        # Candidate arrivals: target node at each time layer in window.
+        # argmin picks the cheapest; ties resolve to earliest arrival.
+        candidates = dist[start_time * N + target_node::N][:horizon - start_time + 1]
+
+        if not np.isfinite(candidates).any():
+            return None
+
+        best = int(np.argmin(candidates))
+        return float(candidates[best]), start_time + best
+
+    def _find_path(self, start_node: int, start_time: int,
                    target_node: int, vehicle_type: str,
-                   deadline: int) -> Tuple[Optional[List[int]], float, int]:
+                   deadline: int) -> Tuple[Optional[List[int]], List[float], float, int]:
         """
-        Find optimal path using A* with time-dependent costs.
-        
+        Find optimal path via Dijkstra on the time-expanded graph.
+
+        One C-level call yields shortest costs to every (node, time)
+        state; the best arrival within the deadline is then a slice
+        over the target node's time layers. Per-step edge costs fall
+        out of the g-score differences along the predecessor chain, so
+        callers never need to re-price committed moves.
+
         Args:
             start_node: Starting node
             start_time: Starting time
             target_node: Target node
             vehicle_type: "truck" or "drone"
             deadline: Latest acceptable arrival
-            
+
         Returns:
-            (path, total_cost, arrival_time) or (None, inf, T) if no path
+            (path, edge_costs, total_cost, arrival_time), where
+            edge_costs[i] prices the step path[i] -> path[i+1];
+            (None, [], inf, T) if no path
         """
-        # Priority queue: (f_score, g_score, node, time, path)
-        pq = [(0, 0, start_node, start_time, [start_node])]
-        visited = {}
-        
-        while pq:
-            f, g, node, time, path = heapq.heappop(pq)
-            
-            # Found target
-            if node == target_node and time <= deadline:
-                return path, g, time
-            
-            # Exceeded time
-            if time >= self.T or time > deadline:
-                continue
-            
-            # Already visited with better cost
-            state = (node, time)
-            if state in visited and visited[state] <= g:
-                continue
-            visited[state] = g
-            
-            # Option 1: Wait (zero cost)
-            heapq.heappush(pq, (g, g, node, time + 1, path + [node]))
-            
-            # Option 2: Move to neighbors
-            for next_node, road_type in self.graph.get_neighbors(node, vehicle_type):
-                # Get edge cost at CURRENT time (before moving)
-                edge_cost = self.cost_calc.get_cost(road_type, time, vehicle_type)
-                
-                if edge_cost is None:
-                    continue
-                
-                new_g = g + edge_cost
-                new_f = new_g  # Simple heuristic (Dijkstra-like)
-                
-                heapq.heappush(pq, (
-                    new_f,
-                    new_g,
-                    next_node,
-                    time + 1,
-                    path + [next_node]
-                ))
-        
-        return None, float('inf'), self.T
-    
-    def _calculate_score(self, arrival: int, obj: Dict) -> float:
+        N = self.graph.num_nodes
+
+        found = self._best_arrival(vehicle_type, start_node, start_time,
+                                   target_node, deadline)
+        if found is None:
+            return None, [], float('inf'), self.T
+
+        total_cost, arrival = found
+        dist, pred = self._sssp_from(vehicle_type, start_node, start_time)
+
+        # Reconstruct path by walking predecessors back to the source;
+        # each step's cost is the g-score delta across that edge
+        path = []
+        edge_costs = []
+        index = arrival * N + target_node
+        while index >= 0:
+            path.append(int(index % N))
+            parent = pred[index]
+            if parent >= 0:
+                edge_costs.append(float(dist[index] - dist[parent]))
+            index = parent
+        path.reverse()
+        edge_costs.reverse()
+
+        return path, edge_costs, total_cost, arrival
+
+    def _calculate_score(self, arrival, obj: Dict):
         """
         Calculate points for objective based on arrival time.
-        
+
+        Branchless and elementwise: arrival may be a scalar or an array
+        of arrival times (one per vehicle), scored in a single pass.
+        Arrivals outside [release, deadline] earn zero via the validity
+        mask instead of early returns.
+
         Args:
-            arrival: Arrival time
+            arrival: Arrival time(s)
             obj: Objective dict
-            
+
         Returns:
-            Points earned (0 if missed)
+            Points earned (0 if missed), matching the shape of arrival
         """
-        # Check validity
-        if arrival < obj['release'] or arrival > obj['deadline']:
-            return 0.0
-        
         # Get late penalty (use objective-specific if available, else global)
         penalty_per_step = obj.get('late_penalty_per_step', self.late_penalty)
-        
-        # Calculate score with late penalty
-        lateness = arrival - obj['release']
-        points = obj['points'] - (penalty_per_step * lateness)
-        
-        return max(0.0, points)
\ No newline at end of file
+
+        arrival = np.asarray(arrival)
+        valid = (arrival >= obj['release']) & (arrival <= obj['deadline'])
+        lateness = np.maximum(arrival - obj['release'], 0)
+
+        return np.maximum(obj['points'] - penalty_per_step * lateness, 0.0) * valid
\ No newline at end of file
@@ -7,30 +7,67 @@ Input/Output and validation functions:
 - Validate solution structure
 """
 
-import json
 import os
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Tuple
 
+import numpy as np
+import orjson
+
+
+# Fleet roster: vehicle id -> vehicle type. Single source of truth for
+# validation instead of re-deriving types via substring search.
+VEHICLE_TYPES = {
+    'truck1': 'truck',
+    'truck2': 'truck',
+    'truck3': 'truck',
+    'drone1': 'drone',
+    'drone2': 'drone',
+}
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(filename: str, mtime: float) -> Dict:
+    """Parse a JSON file with orjson (C decoder); memoized per mtime."""
+    return orjson.loads(Path(filename).read_bytes())
+
+
+def _load_json(filename: str) -> Dict:
+    """
+    Parse a JSON file, reusing the cached parse while it is unchanged.
+
+    Keying the cache on (filename, mtime) means repeated loads (e.g.
+    under a solver sweep) skip the decode, while an edited file is
+    re-read transparently.
+    """
+    return _load_json_cached(filename, os.path.getmtime(filename))
+
 
 def load_inputs() -> Tuple[Dict, Dict, Dict]:
     """
     Load all input files.
-    
+
+    Sensor and road weight series are converted to float32 arrays and
+    the adjacency matrix to int8 right after parsing, so downstream
+    code works on compact, vectorization-ready data.
+
     Returns:
         (map_data, sensor_data, objectives_data)
     """
-    # Load public map
-    with open('map2/public_map_2.json', 'r') as f:
-        map_data = json.load(f)
-    
-    # Load sensor data
-    with open('map2/sensor_data_2.json', 'r') as f:
-        sensor_data = json.load(f)
-    
-    # Load objectives
-    with open('map2/objectives_2.json', 'r') as f:
-        objectives_data = json.load(f)
-    
+    map_data = _load_json('map2/public_map_2.json')
+    sensor_data = _load_json('map2/sensor_data_2.json')
+    objectives_data = _load_json('map2/objectives_2.json')
+
+    map_data['map'] = np.asarray(map_data['map'], dtype=np.int8)
+    map_data['road_weights'] = {
+        k: np.asarray(v, dtype=np.float32)
+        for k, v in map_data['road_weights'].items()
+    }
+    for key, series in sensor_data.items():
+        if isinstance(series, list):
+            sensor_data[key] = np.asarray(series, dtype=np.float32)
+
     return map_data, sensor_data, objectives_data
 
 
@@ -50,8 +87,11 @@ def save_solution(solution: Dict[str, List[int]]):
             "drone2": [...]
         }
     """
-    with open('solution.json', 'w') as f:
-        json.dump(solution, f, indent=2)
+    with open('solution.json', 'wb') as f:
+        f.write(orjson.dumps(
+            solution,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2
+        ))
 
 
 def validate_solution(solution: Dict[str, List[int]], 
@@ -68,42 +108,36 @@ def validate_solution(solution: Dict[str, List[int]],
         (is_valid, list_of_errors)
     """
     errors = []
-    
-    # Expected vehicles
-    expected_vehicles = ['truck1', 'truck2', 'truck3', 'drone1', 'drone2']
-    
-    for vehicle_id in expected_vehicles:
+
+    for vehicle_id, vehicle_type in VEHICLE_TYPES.items():
         if vehicle_id not in solution:
             errors.append(f"Missing vehicle: {vehicle_id}")
             continue
-        
+
         path = solution[vehicle_id]
-        vehicle_type = 'truck' if 'truck' in vehicle_id else 'drone'
-        
+
         # Check path length
         if len(path) != T:
             errors.append(f"{vehicle_id}: Path length {len(path)} != {T}")
-        
-        # Check path validity
-        for t in range(len(path) - 1):
-            current = path[t]
-            next_node = path[t + 1]
-            
-            # Waiting is always valid
-            if current == next_node:
-                continue
-            
-            # Check if edge exists
-            if not graph.is_valid_edge(current, next_node, vehicle_type):
-                road_type = graph.get_road_type(current, next_node)
-                if road_type == -1:
-                    errors.append(
-                        f"{vehicle_id} at t={t}: No road from {current} to {next_node}"
-                    )
-                elif road_type == 0 and vehicle_type == 'truck':
-                    errors.append(
-                        f"{vehicle_id} at t={t}: Truck cannot use airspace (road type 0)"
-                    )
+
+        # Check path validity: gather road types for all (t, t+1) moves
+        # in one pass instead of per-step Python calls
+        p = np.asarray(path)
+        road_types = graph.adj[p[:-1], p[1:]]
+        moving = p[:-1] != p[1:]  # waiting is always valid
+
+        no_road = moving & (road_types == -1)
+        truck_in_air = moving & (road_types == 0) & (vehicle_type == 'truck')
+
+        for t in np.nonzero(no_road | truck_in_air)[0]:
+            if no_road[t]:
+                errors.append(
+                    f"{vehicle_id} at t={t}: No road from {p[t]} to {p[t + 1]}"
+                )
+            else:
+                errors.append(
+                    f"{vehicle_id} at t={t}: Truck cannot use airspace (road type 0)"
+                )
     
     is_valid = len(errors) == 0
     return is_valid, errors